@@ -1,15 +1,18 @@
 """peewee-validates is a validator module designed to work with the Peewee ORM."""
 
+import copy
 import datetime
 import re
 from decimal import Decimal
 from decimal import InvalidOperation
+from functools import lru_cache
 from inspect import isgeneratorfunction
 from inspect import isgenerator
-from collections import Iterable
+from collections import ChainMap
+from collections.abc import Iterable
+from types import MappingProxyType
 
 import peewee
-from dateutil.parser import parse as dateutil_parse
 try:
     from playhouse.fields import ManyToManyField
 except ImportError:
@@ -25,7 +28,9 @@ __all__ = [
 
 PEEWEE3 = peewee.__version__ >= '3.0.0'
 
-DEFAULT_MESSAGES = {
+# Read-only so the defaults can be shared safely between every validator;
+# per-class overrides belong in Meta.messages.
+DEFAULT_MESSAGES = MappingProxyType({
     'required': 'This field is required.',
     'empty': 'This field must not be blank.',
     'one_of': 'Must be one of the choices: {choices}.',
@@ -52,11 +57,14 @@ DEFAULT_MESSAGES = {
     'list': 'Must be a list of values',
     'unique': 'Must be a unique value.',
     'index': 'Fields must be unique together.',
-}
+})
 
 
 class ValidationError(Exception):
     """An exception class that should be raised when a validation error occurs on data."""
+
+    __slots__ = ('key', 'kwargs')
+
     def __init__(self, key, *args, **kwargs):
         self.key = key
         self.kwargs = kwargs
@@ -121,14 +129,32 @@ def validate_one_of(values):
     :param values: Iterable of valid values.
     :raises: ``ValidationError('one_of')``
     """
+    # Static choices can be frozen once so the membership test is a hash
+    # lookup; the ordered tuple is kept for the error message.
+    if not callable(values):
+        values = tuple(values)
+        try:
+            members = frozenset(values)
+        except TypeError:
+            # Unhashable choices fall back to linear tuple containment.
+            members = values
+        choices = ', '.join(map(str, values))
+
     def one_of_validator(field, data):
         if field.value is None:
             return
-        options = values
-        if callable(options):
-            options = options()
-        if field.value not in options:
-            raise ValidationError('one_of', choices=', '.join(map(str, options)))
+        if callable(values):
+            options = values()
+            if field.value not in options:
+                raise ValidationError('one_of', choices=', '.join(map(str, options)))
+        else:
+            try:
+                found = field.value in members
+            except TypeError:
+                # An unhashable value cannot equal any of the hashable choices.
+                found = False
+            if not found:
+                raise ValidationError('one_of', choices=choices)
     return one_of_validator
 
 
@@ -139,12 +165,27 @@ def validate_none_of(values):
     :param values: Iterable of invalid values.
     :raises: ``ValidationError('none_of')``
     """
+    if not callable(values):
+        values = tuple(values)
+        try:
+            members = frozenset(values)
+        except TypeError:
+            # Unhashable choices fall back to linear tuple containment.
+            members = values
+        choices = ', '.join(map(str, values))
+
     def none_of_validator(field, data):
-        options = values
-        if callable(options):
-            options = options()
-        if field.value in options:
-            raise ValidationError('none_of', choices=str.join(', ', options))
+        if callable(values):
+            options = values()
+            if field.value in options:
+                raise ValidationError('none_of', choices=str.join(', ', options))
+        else:
+            try:
+                found = field.value in members
+            except TypeError:
+                found = False
+            if found:
+                raise ValidationError('none_of', choices=choices)
     return none_of_validator
 
 
@@ -245,24 +286,29 @@ def validate_function(method, **kwargs):
     return function_validator
 
 
+EMAIL_USER_REGEX = re.compile(
+    r"(^[-!#$%&'*+/=?^`{}|~\w]+(\.[-!#$%&'*+/=?^`{}|~\w]+)*$"
+    r'|^"([\001-\010\013\014\016-\037!#-\[\]-\177]'
+    r'|\\[\001-\011\013\014\016-\177])*"$)', re.IGNORECASE | re.UNICODE)
+
+EMAIL_DOMAIN_REGEX = re.compile(
+    r'(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+'
+    r'(?:[A-Z]{2,6}|[A-Z0-9-]{2,})$'
+    r'|^\[(25[0-5]|2[0-4]\d|[0-1]?\d?\d)'
+    r'(\.(25[0-5]|2[0-4]\d|[0-1]?\d?\d)){3}\]$', re.IGNORECASE | re.UNICODE)
+
+EMAIL_DOMAIN_WHITELIST = ('localhost',)
+
+
 def validate_email():
     """
     Validate the field is a valid email address.
 
     :raises: ``ValidationError('email')``
     """
-    user_regex = re.compile(
-        r"(^[-!#$%&'*+/=?^`{}|~\w]+(\.[-!#$%&'*+/=?^`{}|~\w]+)*$"
-        r'|^"([\001-\010\013\014\016-\037!#-\[\]-\177]'
-        r'|\\[\001-\011\013\014\016-\177])*"$)', re.IGNORECASE | re.UNICODE)
-
-    domain_regex = re.compile(
-        r'(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+'
-        r'(?:[A-Z]{2,6}|[A-Z0-9-]{2,})$'
-        r'|^\[(25[0-5]|2[0-4]\d|[0-1]?\d?\d)'
-        r'(\.(25[0-5]|2[0-4]\d|[0-1]?\d?\d)){3}\]$', re.IGNORECASE | re.UNICODE)
-
-    domain_whitelist = ('localhost',)
+    user_regex = EMAIL_USER_REGEX
+    domain_regex = EMAIL_DOMAIN_REGEX
+    domain_whitelist = EMAIL_DOMAIN_WHITELIST
 
     def email_validator(field, data):
         if field.value is None:
@@ -304,9 +350,9 @@ def validate_model_unique(lookup_field, queryset, pk_field=None, pk_value=None):
     def unique_validator(field, data):
         # If we have a PK, ignore it because it represents the current record.
         query = queryset.where(lookup_field == field.value)
-        if pk_field and pk_value:
+        if pk_field is not None and pk_value is not None:
             query = query.where(~(pk_field == pk_value))
-        if query.count():
+        if query.exists():
             raise ValidationError('unique')
     return unique_validator
 
@@ -345,6 +391,130 @@ def isiterable_notstring(value):
     return isinstance(value, Iterable) or isgeneratorfunction(value) or isgenerator(value)
 
 
+if PEEWEE3:
+    def get_pk_value(instance):
+        """
+        Get the primary key value from a model instance.
+
+        :param instance: Peewee model instance.
+        """
+        return instance.get_id()
+
+    def get_instance_data(instance):
+        """
+        Get the raw data dictionary from a model instance.
+
+        :param instance: Peewee model instance.
+        """
+        return instance.__data__
+
+    def get_field_type(field):
+        """
+        Get the type name for a model field, matching the keys of ``ModelValidator.FIELD_MAP``.
+
+        :param field: Peewee field instance.
+        """
+        return field.field_type.lower()
+else:
+    def get_pk_value(instance):
+        """
+        Get the primary key value from a model instance.
+
+        :param instance: Peewee model instance.
+        """
+        return instance._get_pk_value()
+
+    def get_instance_data(instance):
+        """
+        Get the raw data dictionary from a model instance.
+
+        :param instance: Peewee model instance.
+        """
+        return instance._data
+
+    def get_field_type(field):
+        """
+        Get the type name for a model field, matching the keys of ``ModelValidator.FIELD_MAP``.
+
+        :param field: Peewee field instance.
+        """
+        return field.db_field
+
+
+_dateutil_parse = None
+
+
+def dateutil_parse(value):
+    """
+    Parse a date/time value with `dateutil.parser.parse`, importing dateutil on first use.
+    The import is deferred because only the non-ISO parsing paths need it.
+
+    :param value: Value to parse.
+    """
+    global _dateutil_parse
+    if _dateutil_parse is None:
+        from dateutil.parser import parse as _dateutil_parse
+    return _dateutil_parse(value)
+
+
+@lru_cache(maxsize=1024)
+def cached_dateutil_parse(value):
+    """
+    Memoized `dateutil_parse` for strings. Freeform parsing is expensive and
+    batch data tends to repeat the same handful of values. dateutil fills in
+    missing components from the current date, so cached results are only safe
+    where the date half is discarded — use this from `parse_time` only.
+
+    :param value: String to parse.
+    """
+    return dateutil_parse(value)
+
+
+def parse_date(value):
+    """
+    Convert the given value to a date.
+    ISO-8601 strings take a fast path, anything else goes through `dateutil.parser.parse`.
+
+    :param value: Value to convert.
+    """
+    if isinstance(value, str):
+        try:
+            return datetime.date.fromisoformat(value)
+        except ValueError:
+            return dateutil_parse(value).date()
+    return dateutil_parse(value).date()
+
+
+def parse_time(value):
+    """
+    Convert the given value to a time.
+    ISO-8601 strings take a fast path, anything else goes through `dateutil.parser.parse`.
+
+    :param value: Value to convert.
+    """
+    if isinstance(value, str):
+        try:
+            return datetime.time.fromisoformat(value)
+        except ValueError:
+            return cached_dateutil_parse(value).time()
+    return dateutil_parse(value).time()
+
+
+def parse_datetime(value):
+    """
+    Convert the given value to a datetime.
+    ISO-8601 strings take a fast path, anything else goes through `dateutil.parser.parse`.
+
+    :param value: Value to convert.
+    """
+    if isinstance(value, str):
+        try:
+            return datetime.datetime.fromisoformat(value)
+        except ValueError:
+            return dateutil_parse(value)
+    return dateutil_parse(value)
+
+
 class Field:
     """
     Base class from which all other fields should be derived.
@@ -359,9 +529,10 @@ class Field:
     def __init__(self, required=False, default=None, validators=None):
         self.default = default
         self.value = None
-        self.validators = validators or []
-        if required:
-            self.validators.append(validate_required())
+        self.required = required
+        # The pipeline of validators is fixed once the field is constructed,
+        # so freeze it into a tuple for cheaper iteration in validate().
+        self.validators = tuple(validators) if validators else ()
 
     def coerce(self, value):
         """
@@ -389,7 +560,7 @@ class Field:
         """
         if name in data:
             return data.get(name)
-        if self.default:
+        if self.default is not None:
             if callable(self.default):
                 return self.default()
             return self.default
@@ -408,6 +579,11 @@ class Field:
         self.value = self.get_value(name, data)
         if self.value is not None:
             self.value = self.coerce(self.value)
+        # A required field fails fast on a missing value. Otherwise the loop
+        # must run even when the value is None, because validators like
+        # validate_required act on missing values.
+        if self.value is None and self.required:
+            raise ValidationError('required')
         for method in self.validators:
             method(self, data)
 
@@ -423,15 +599,17 @@ class StringField(Field):
     :param min_length: Minimum length that should be enfocred.
     """
 
-    __slots__ = ('value', 'required', 'default', 'validators')
+    __slots__ = ()
 
     def __init__(self, required=False, max_length=None, min_length=None, default=None, validators=None):
-        validators = validators or []
-        if max_length or min_length:
+        validators = list(validators) if validators else []
+        if max_length is not None or min_length is not None:
             validators.append(validate_length(high=max_length, low=min_length))
         super().__init__(required=required, default=default, validators=validators)
 
     def coerce(self, value):
+        if isinstance(value, str):
+            return value
         return str(value)
 
 
@@ -446,18 +624,22 @@ class FloatField(Field):
     :param high: Highest value that should be enfocred.
     """
 
-    __slots__ = ('value', 'required', 'default', 'validators')
+    __slots__ = ()
 
     def __init__(self, required=False, low=None, high=None, default=None, validators=None):
-        validators = validators or []
-        if low or high:
+        validators = list(validators) if validators else []
+        if low is not None or high is not None:
             validators.append(validate_range(low=low, high=high))
         super().__init__(required=required, default=default, validators=validators)
 
     def coerce(self, value):
+        if isinstance(value, float):
+            return value
+        if value == '':
+            return None
         try:
-            return float(value) if value else None
-        except (TypeError, ValueError):
+            return float(value)
+        except (TypeError, ValueError, OverflowError):
             raise ValidationError('coerce_float')
 
 
@@ -472,18 +654,20 @@ class IntegerField(Field):
     :param high: Highest value that should be enfocred.
     """
 
-    __slots__ = ('value', 'required', 'default', 'validators')
+    __slots__ = ()
 
     def __init__(self, required=False, low=None, high=None, default=None, validators=None):
-        validators = validators or []
-        if low or high:
+        validators = list(validators) if validators else []
+        if low is not None or high is not None:
             validators.append(validate_range(low=low, high=high))
         super().__init__(required=required, default=default, validators=validators)
 
     def coerce(self, value):
+        if isinstance(value, int) and not isinstance(value, bool):
+            return value
         try:
             return int(value) if value is not None else None
-        except (TypeError, ValueError):
+        except (TypeError, ValueError, OverflowError):
             raise ValidationError('coerce_int')
 
 
@@ -498,18 +682,22 @@ class DecimalField(Field):
     :param high: Highest value that should be enfocred.
     """
 
-    __slots__ = ('value', 'required', 'default', 'validators')
+    __slots__ = ()
 
     def __init__(self, required=False, low=None, high=None, default=None, validators=None):
-        validators = validators or []
-        if low or high:
+        validators = list(validators) if validators else []
+        if low is not None or high is not None:
             validators.append(validate_range(low=low, high=high))
         super().__init__(required=required, default=default, validators=validators)
 
     def coerce(self, value):
+        if isinstance(value, Decimal):
+            return value
+        if value == '':
+            return None
         try:
-            return Decimal(value) if value else None
-        except (TypeError, ValueError, InvalidOperation):
+            return Decimal(value)
+        except (TypeError, ValueError, OverflowError, InvalidOperation):
             raise ValidationError('coerce_decimal')
 
 
@@ -526,20 +714,24 @@ class DateField(Field):
     :param high: Highest value that should be enfocred.
     """
 
-    __slots__ = ('value', 'required', 'default', 'validators')
+    __slots__ = ()
 
     def __init__(self, required=False, low=None, high=None, default=None, validators=None):
-        validators = validators or []
-        if low or high:
-            validators.append(validate_range(low=low, high=high))
+        validators = list(validators) if validators else []
+        if low is not None or high is not None:
+            # Parse string bounds once here, so the range validator compares
+            # native objects instead of re-parsing the bounds on every call.
+            validators.append(validate_range(low=self.coerce(low), high=self.coerce(high)))
         super().__init__(required=required, default=default, validators=validators)
 
     def coerce(self, value):
+        if value == '':
+            return None
         if not value or isinstance(value, datetime.date):
             return value
         try:
-            return dateutil_parse(value).date()
-        except (TypeError, ValueError):
+            return parse_date(value)
+        except (TypeError, ValueError, OverflowError):
             raise ValidationError('coerce_date')
 
 
@@ -556,20 +748,24 @@ class TimeField(Field):
     :param high: Highest value that should be enfocred.
     """
 
-    __slots__ = ('value', 'required', 'default', 'validators')
+    __slots__ = ()
 
     def __init__(self, required=False, low=None, high=None, default=None, validators=None):
-        validators = validators or []
-        if low or high:
-            validators.append(validate_range(low=low, high=high))
+        validators = list(validators) if validators else []
+        if low is not None or high is not None:
+            # Parse string bounds once here, so the range validator compares
+            # native objects instead of re-parsing the bounds on every call.
+            validators.append(validate_range(low=self.coerce(low), high=self.coerce(high)))
         super().__init__(required=required, default=default, validators=validators)
 
     def coerce(self, value):
+        if value == '':
+            return None
         if not value or isinstance(value, datetime.time):
             return value
         try:
-            return dateutil_parse(value).time()
-        except (TypeError, ValueError):
+            return parse_time(value)
+        except (TypeError, ValueError, OverflowError):
             raise ValidationError('coerce_time')
 
 
@@ -586,20 +782,24 @@ class DateTimeField(Field):
     :param high: Highest value that should be enfocred.
     """
 
-    __slots__ = ('value', 'required', 'default', 'validators')
+    __slots__ = ()
 
     def __init__(self, required=False, low=None, high=None, default=None, validators=None):
-        validators = validators or []
-        if low or high:
-            validators.append(validate_range(low=low, high=high))
+        validators = list(validators) if validators else []
+        if low is not None or high is not None:
+            # Parse string bounds once here, so the range validator compares
+            # native objects instead of re-parsing the bounds on every call.
+            validators.append(validate_range(low=self.coerce(low), high=self.coerce(high)))
         super().__init__(required=required, default=default, validators=validators)
 
     def coerce(self, value):
+        if value == '':
+            return None
         if not value or isinstance(value, datetime.datetime):
             return value
         try:
-            return dateutil_parse(value)
-        except (TypeError, ValueError):
+            return parse_datetime(value)
+        except (TypeError, ValueError, OverflowError):
             raise ValidationError('coerce_datetime')
 
 
@@ -611,11 +811,13 @@ class BooleanField(Field):
     And everything else is True.
     """
 
-    __slots__ = ('value', 'required', 'default', 'validators')
+    __slots__ = ()
 
-    false_values = ('0', '{}', '[]', 'none', 'false')
+    false_values = frozenset(('0', '{}', '[]', 'none', 'false'))
 
     def coerce(self, value):
+        if isinstance(value, bool):
+            return value
         return not str(value).lower() in self.false_values
 
 
@@ -627,15 +829,22 @@ class ModelChoiceField(Field):
     :param lookup_field: Field that will be queried for the value.
     """
 
-    __slots__ = ('query', 'lookup_field', 'value', 'required', 'default', 'validators')
+    __slots__ = ('query', 'lookup_field', 'rel_model')
 
     def __init__(self, query, lookup_field, required=False, **kwargs):
         self.query = query
         self.lookup_field = lookup_field
+        # self.query could be a query like "User.select()" or a model like "User".
+        if isinstance(query, peewee.Query):
+            self.rel_model = getattr(query, 'model', None) or getattr(query, 'model_class', None)
+        else:
+            self.rel_model = query
         super().__init__(required=required, **kwargs)
 
     def coerce(self, value):
         """Convert from whatever is given to a scalar value for lookup_field."""
+        if self.rel_model is not None and isinstance(value, self.rel_model):
+            return value
         return coerce_single_instance(self.lookup_field, value)
 
     def validate(self, name, data):
@@ -647,7 +856,9 @@ class ModelChoiceField(Field):
         :raises: ValidationError
         """
         super().validate(name, data)
-        if self.value is not None:
+        # If the value is already an instance of the related model there is no
+        # reason to query for it again.
+        if self.value is not None and not isinstance(self.value, peewee.Model):
             try:
                 self.value = self.query.get(self.lookup_field == self.value)
             except (AttributeError, ValueError, peewee.DoesNotExist):
@@ -662,7 +873,7 @@ class ManyModelChoiceField(Field):
     :param lookup_field: Field that will be queried for the value.
     """
 
-    __slots__ = ('query', 'lookup_field', 'value', 'required', 'default', 'validators')
+    __slots__ = ('query', 'lookup_field')
 
     def __init__(self, query, lookup_field, required=False, **kwargs):
         self.query = query
@@ -687,18 +898,29 @@ class ManyModelChoiceField(Field):
         """
         super().validate(name, data)
         if self.value is not None:
+            values = [v for v in self.value if v]
+            if not values:
+                self.value = []
+                return
             try:
                 # self.query could be a query like "User.select()" or a model like "User"
-                # so ".select().where()" handles both cases.
-                self.value = [self.query.select().where(self.lookup_field == v).get() for v in self.value if v]
-            except (AttributeError, ValueError, peewee.DoesNotExist):
+                # so ".select().where()" handles both cases. One IN query fetches every
+                # instance at once instead of issuing a lookup per value.
+                query = self.query.select().where(self.lookup_field.in_(values))
+                instances = {getattr(instance, self.lookup_field.name): instance for instance in query}
+                self.value = [instances[self.lookup_field.python_value(v)] for v in values]
+            except (AttributeError, KeyError, ValueError):
                 raise ValidationError('related', field=self.lookup_field.name, values=self.value)
 
 
 class ValidatorOptions:
+    # No __slots__ here: Meta can carry arbitrary user attributes, and they
+    # must all be reachable through _meta.
+
     def __init__(self, obj):
         self.fields = {}
         self.messages = {}
+        self.error_messages = {}
         self.only = []
         self.exclude = []
 
@@ -722,35 +944,90 @@ class Validator:
 
     __slots__ = ('data', 'errors', '_meta')
 
+    _cleaners = {}
+    _field_defs = {}
+    _meta_template = None
+    _message_cache = {}
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Collect the ``clean_<name>`` methods and the ``Field`` instances defined on this
+        subclass (and its parents) into lookup tables, so that neither instantiation nor
+        validation has to rediscover them with per-attribute ``getattr`` calls.
+        Also parse the ``Meta`` options once per class into a template that instances copy.
+        """
+        super().__init_subclass__(**kwargs)
+        # Walk the full MRO (base first) so fields and cleaners declared on any
+        # base — including non-Validator mixins — are collected, like the
+        # getattr lookups this replaced.
+        cleaners = {}
+        field_defs = {}
+        for klass in reversed(cls.__mro__):
+            for name, attr in klass.__dict__.items():
+                if name.startswith('clean_') and callable(attr):
+                    cleaners[name[len('clean_'):]] = attr
+                elif isinstance(attr, Field):
+                    field_defs[name] = attr
+                elif name in field_defs:
+                    # A subclass shadowed an inherited field with something else.
+                    del field_defs[name]
+        cls._cleaners = cleaners
+        cls._field_defs = field_defs
+        cls._meta_template = cls._build_meta_template()
+        cls._message_cache = {}
+
+    @classmethod
+    def _build_meta_template(cls):
+        """
+        Parse the ``Meta`` options declared on this class into a ``ValidatorOptions``
+        instance, so that ``__init__`` can copy it instead of reparsing per instance.
+        """
+        meta = ValidatorOptions(None)
+        for key, value in cls.Meta.__dict__.items():
+            if not key.startswith('_'):
+                setattr(meta, key, value)
+        meta.only = frozenset(meta.only)
+        meta.exclude = frozenset(meta.exclude)
+        if meta.messages:
+            meta.error_messages = ChainMap(meta.messages, DEFAULT_MESSAGES)
+        else:
+            meta.error_messages = DEFAULT_MESSAGES
+        return meta
+
     def __init__(self):
         self.errors = {}
         self.data = {}
 
-        self._meta = ValidatorOptions(self)
-        self._meta.__dict__.update(self.Meta.__dict__)
+        template = type(self)._meta_template
+        if template is None:
+            # The base Validator class never goes through __init_subclass__.
+            template = type(self)._meta_template = self._build_meta_template()
+        self._meta = copy.copy(template)
+        self._meta.fields = {}
 
         self.initialize_fields()
 
     def add_error(self, name, error):
-        message = self._meta.messages.get('{}.{}'.format(name, error.key))
-        if not message:
-            message = self._meta.messages.get(error.key)
-        if not message:
-            message = DEFAULT_MESSAGES.get(error.key, 'Validation failed.')
+        # The resolved template for a (field, key) pair never changes for a given
+        # class, so remember it and skip the prefixed lookup chain next time.
+        cache_key = (name, error.key)
+        message = self._message_cache.get(cache_key)
+        if message is None:
+            messages = self._meta.error_messages
+            message = messages.get(f'{name}.{error.key}') or messages.get(error.key)
+            if not message:
+                message = 'Validation failed.'
+            self._message_cache[cache_key] = message
         self.errors[name] = message.format(**error.kwargs)
 
     def initialize_fields(self):
         """
-        The dict self.base_fields is a model instance at this point.
-        Turn it into an instance attribute on this meta class.
+        Add the fields collected at class-definition time to the meta options.
         Also intitialize any other special fields if needed in sub-classes.
 
         :return: None
         """
-        for field in dir(self):
-            obj = getattr(self, field)
-            if isinstance(obj, Field):
-                self._meta.fields[field] = obj
+        self._meta.fields.update(self._field_defs)
 
     def validate(self, data=None, only=None, exclude=None):
         """
@@ -764,16 +1041,18 @@ class Validator:
         :param exclude: List or tuple of fields to exclude from validation.
         :return: True if validation was successful. Otherwise False.
         """
-        only = only or []
-        exclude = exclude or []
+        only = frozenset(only or self._meta.only)
+        exclude = frozenset(exclude or self._meta.exclude)
         data = data or {}
         self.errors = {}
         self.data = {}
 
-        # Validate individual fields.
-        for name, field in self._meta.fields.items():
-            if name in exclude or (only and name not in only):
-                continue
+        # Validate individual fields. Only filter the field list when there is
+        # actually something to filter, so the common case is a plain iteration.
+        fields = self._meta.fields.items()
+        if only or exclude:
+            fields = [(n, f) for n, f in fields if n not in exclude and (not only or n in only)]
+        for name, field in fields:
             try:
                 field.validate(name, data)
             except ValidationError as err:
@@ -794,6 +1073,26 @@ class Validator:
 
         return (not self.errors)
 
+    def validate_many(self, rows, only=None, exclude=None):
+        """
+        Validate a list of data dictionaries, reusing this validator instance for each one
+        instead of constructing a new validator per row.
+
+        Each entry in the result is a ``(valid, data, errors)`` tuple holding what
+        ``self.data`` and ``self.errors`` contained after validating that row.
+
+        :param rows: Iterable of dictionaries of data to validate.
+        :param only: List or tuple of fields to validate.
+        :param exclude: List or tuple of fields to exclude from validation.
+        :return: List of ``(valid, data, errors)`` tuples, one per row.
+        :rtype: list
+        """
+        results = []
+        for row in rows:
+            valid = self.validate(row, only=only, exclude=exclude)
+            results.append((valid, self.data, self.errors))
+        return results
+
     def clean_fields(self, data):
         """
         For each field, check to see if there is a clean_<name> method.
@@ -806,9 +1105,9 @@ class Validator:
         """
         for name, value in data.items():
             try:
-                method = getattr(self, 'clean_{}'.format(name), None)
+                method = self._cleaners.get(name)
                 if method:
-                    self.data[name] = method(value)
+                    self.data[name] = method(self, value)
             except ValidationError as err:
                 self.add_error(name, err)
                 continue
@@ -854,31 +1153,54 @@ class ModelValidator(Validator):
 
         self.instance = instance
         self.pk_field = self.instance._meta.primary_key
-        if PEEWEE3:
-            self.pk_value = self.instance.get_id()
-        else:
-            self.pk_value = self.instance._get_pk_value()
+        self.pk_value = get_pk_value(self.instance)
 
         super().__init__()
 
+    INDEX_CACHE = {}
+
     def initialize_fields(self):
         """
         Convert all model fields to validator fields.
         Then call the parent so that overwrites can happen if necessary for manually defined fields.
 
+        Converted fields that do not depend on the model instance are cached on
+        the validator class, keyed by model class, so the cache is collected
+        along with validator classes defined inside functions. Fields with a
+        unique constraint embed the instance's primary key in their validators,
+        so they are rebuilt every time.
+
         :return: None
         """
-        # # Pull all the "normal" fields off the model instance meta.
+        cls = type(self)
+        cache = cls.__dict__.get('_field_cache')
+        if cache is None:
+            cache = {}
+            cls._field_cache = cache
+        cached = cache.get(type(self.instance))
+        if cached is None:
+            cached = {}
+
+            # Pull all the "normal" fields off the model instance meta.
+            for name, field in self.instance._meta.fields.items():
+                if getattr(field, 'primary_key', False) or getattr(field, 'unique', False):
+                    continue
+                cached[name] = self.convert_field(name, field)
+
+            # Many-to-many fields are not stored in the meta fields dict.
+            # Pull them directly off the class.
+            for name in dir(type(self.instance)):
+                field = getattr(type(self.instance), name, None)
+                if isinstance(field, ManyToManyField):
+                    cached[name] = self.convert_field(name, field)
+
+            cache[type(self.instance)] = cached
+
+        self._meta.fields.update(cached)
+
+        # Unique fields must exclude this instance's primary key from their checks.
         for name, field in self.instance._meta.fields.items():
-            if getattr(field, 'primary_key', False):
-                continue
-            self._meta.fields[name] = self.convert_field(name, field)
-
-        # Many-to-many fields are not stored in the meta fields dict.
-        # Pull them directly off the class.
-        for name in dir(type(self.instance)):
-            field = getattr(type(self.instance), name, None)
-            if isinstance(field, ManyToManyField):
+            if getattr(field, 'unique', False) and not getattr(field, 'primary_key', False):
                 self._meta.fields[name] = self.convert_field(name, field)
 
         super().initialize_fields()
@@ -891,12 +1213,7 @@ class ModelValidator(Validator):
         :param name: Peewee field instance.
         :return: Validator field.
         """
-        if PEEWEE3:
-            field_type = field.field_type.lower()
-        else:
-            field_type = field.db_field
-
-        pwv_field = ModelValidator.FIELD_MAP.get(field_type, StringField)
+        pwv_field = ModelValidator.FIELD_MAP.get(get_field_type(field), StringField)
 
         validators = []
         required = not bool(getattr(field, 'null', True))
@@ -905,9 +1222,6 @@ class ModelValidator(Validator):
         max_length = getattr(field, 'max_length', None)
         unique = getattr(field, 'unique', False)
 
-        if required:
-            validators.append(validate_required())
-
         if choices:
             validators.append(validate_one_of([c[0] for c in choices]))
 
@@ -922,14 +1236,16 @@ class ModelValidator(Validator):
                 rel_field = field.rel_field
             else:
                 rel_field = field.to_field
-            return ModelChoiceField(field.rel_model, rel_field, default=default, validators=validators)
+            return ModelChoiceField(
+                field.rel_model, rel_field,
+                required=required, default=default, validators=validators)
 
         if isinstance(field, ManyToManyField):
             return ManyModelChoiceField(
                 field.rel_model, field.rel_model._meta.primary_key,
-                default=default, validators=validators)
+                required=required, default=default, validators=validators)
 
-        return pwv_field(default=default, validators=validators)
+        return pwv_field(required=required, default=default, validators=validators)
 
     def validate(self, data=None, only=None, exclude=None):
         """
@@ -947,20 +1263,20 @@ class ModelValidator(Validator):
         :return: True if validation is successful, otherwise False.
         """
         data = data or {}
-        only = only or self._meta.only
-        exclude = exclude or self._meta.exclude
+        only = frozenset(only or self._meta.only)
+        exclude = frozenset(exclude or self._meta.exclude)
 
+        # Layer values from the model instance underneath the incoming data instead of
+        # copying them in, so the caller's dict is never mutated.
+        instance_data = {}
         for name, field in self.instance._meta.fields.items():
-            if name in exclude or (only and name not in only):
+            if name in exclude or (only and name not in only) or name in data:
                 continue
             try:
-                data.setdefault(name, getattr(self.instance, name, None))
+                instance_data[name] = getattr(self.instance, name, None)
             except (peewee.DoesNotExist):
-                if PEEWEE3:
-                    instance_data = self.instance.__data__
-                else:
-                    instance_data = self.instance._data
-                data.setdefault(name, instance_data.get(name, None))
+                instance_data[name] = get_instance_data(self.instance).get(name, None)
+        data = ChainMap(data, instance_data)
 
         # This will set self.data which we should use from now on.
         super().validate(data=data, only=only, exclude=exclude)
@@ -978,22 +1294,25 @@ class ModelValidator(Validator):
 
         :return: None
         """
-        # Build a list of dict containing query values for each unique index.
-        index_data = []
-        for columns, unique in self.instance._meta.indexes:
-            if not unique:
-                continue
-            index_data.append({col: data.get(col, None) for col in columns})
-
-        # Then query for each unique index to see if the value is unique.
-        for index in index_data:
+        # The set of unique indexes is a property of the model class, so parse
+        # the index definitions once and reuse them for every validation.
+        model_class = type(self.instance)
+        unique_indexes = ModelValidator.INDEX_CACHE.get(model_class)
+        if unique_indexes is None:
+            unique_indexes = tuple(
+                tuple(columns) for columns, unique in self.instance._meta.indexes if unique)
+            ModelValidator.INDEX_CACHE[model_class] = unique_indexes
+
+        # Query once for each unique index to see if the values are unique.
+        for columns in unique_indexes:
+            index = {col: data.get(col, None) for col in columns}
             query = self.instance.filter(**index)
             # If we have a primary key, need to exclude the current record from the check.
-            if self.pk_field and self.pk_value:
+            if self.pk_field is not None and self.pk_value is not None:
                 query = query.where(~(self.pk_field == self.pk_value))
-            if query.count():
-                err = ValidationError('index', fields=str.join(', ', index.keys()))
-                for col in index.keys():
+            if query.exists():
+                err = ValidationError('index', fields=str.join(', ', columns))
+                for col in columns:
                     self.add_error(col, err)
 
     def save(self, force_insert=False):
@@ -1004,6 +1323,7 @@ class ModelValidator(Validator):
         :return: Number of rows impacted, or False.
         """
         delayed = {}
+        direct = {}
         for field, value in self.data.items():
             model_field = getattr(type(self.instance), field, None)
 
@@ -1015,7 +1335,18 @@ class ModelValidator(Validator):
                     delayed[field] = value
                 continue
 
-            setattr(self.instance, field, value)
+            # Plain model fields can be written straight into the instance data in one batch.
+            # Foreign keys (and anything that is not a model field) still go through setattr
+            # so peewee can maintain its relation cache and extract the related key.
+            if PEEWEE3 and isinstance(model_field, peewee.Field) \
+                    and not isinstance(model_field, peewee.ForeignKeyField):
+                direct[field] = value
+            else:
+                setattr(self.instance, field, value)
+
+        if direct:
+            self.instance.__data__.update(direct)
+            self.instance._dirty.update(direct)
 
         rv = self.instance.save(force_insert=force_insert)
 
@@ -0,0 +1,28 @@
+import pytest
+
+from tests.models import database
+from tests.models import BasicFields
+from tests.models import ComplexPerson
+from tests.models import Course
+from tests.models import Organization
+from tests.models import PayGrade
+from tests.models import Person
+from tests.models import Student
+
+
+@pytest.fixture(scope='session', autouse=True)
+def create_schema():
+    """Create all tables once per test session and seed the shared organization row."""
+    database.create_tables([
+        Organization, PayGrade, ComplexPerson, Person, BasicFields,
+        Student, Course, Course.students.get_through_model(),
+    ])
+    Organization.create(name='main')
+
+
+@pytest.fixture(autouse=True)
+def rollback_transaction():
+    """Run each test inside a transaction that is rolled back, so tests never leak rows."""
+    with database.atomic() as transaction:
+        yield
+        transaction.rollback()
@@ -77,17 +77,3 @@ class Course(peewee.Model):
 
     class Meta:
         database = database
-
-
-Organization.create_table(fail_silently=True)
-PayGrade.create_table(fail_silently=True)
-ComplexPerson.create_table(fail_silently=True)
-Person.create_table(fail_silently=True)
-BasicFields.create_table(fail_silently=True)
-
-Student.create_table(fail_silently=True)
-Course.create_table(fail_silently=True)
-Course.students.get_through_model().create_table(fail_silently=True)
-
-organization = Organization(name='main')
-organization.save()
@@ -2,6 +2,8 @@ from datetime import date
 from datetime import datetime
 from datetime import time
 
+import pytest
+
 from peewee_validates import DEFAULT_MESSAGES
 from peewee_validates import Field
 from peewee_validates import Validator
@@ -16,6 +18,7 @@ from peewee_validates import TimeField
 from peewee_validates import DateTimeField
 from peewee_validates import BooleanField
 from peewee_validates import validate_not_empty
+from peewee_validates import validate_required
 from peewee_validates import validate_one_of
 from peewee_validates import validate_none_of
 from peewee_validates import validate_equal
@@ -24,58 +27,243 @@ from peewee_validates import validate_email
 from peewee_validates import validate_function
 
 
-def test_raw_field():
-    class TestValidator(Validator):
-        field1 = Field()
+# Helper callables and validator classes that do not depend on test-local state
+# are defined once at module scope, so each test does not pay for field
+# discovery and Meta parsing.
+
+def getname():
+    return 'timster'
+
+
+def getchoices():
+    return ('tim', 'bob')
+
+
+def alwaystim(value):
+    if value == 'tim':
+        return True
+
+
+class RawFieldValidator(Validator):
+    field1 = Field()
+
+
+class RequiredFieldsValidator(Validator):
+    bool_field = BooleanField(required=True)
+    decimal_field = DecimalField(required=True)
+    float_field = FloatField(required=True, low=10.0, high=50.0)
+    int_field = IntegerField(required=True)
+    str_field = StringField(required=True)
+    date_field = DateField(required=True, low='jan 1, 2010', high='dec 1, 2010')
+    time_field = TimeField(required=True, low='9 am', high='10 am')
+    datetime_field = DateTimeField(required=True, low='jan 1, 2010', high='dec 1, 2010')
+
+
+class IntegerValidator(Validator):
+    int_field = IntegerField(required=True)
+
+
+class CoerceValidator(Validator):
+    float_field = FloatField()
+    int_field = IntegerField(required=True)
+    decimal_field = DecimalField(required=True)
+    boolean_field = BooleanField()
+
+
+class DecimalRangeValidator(Validator):
+    low_field = DecimalField(low=-42.0)
+    high_field = DecimalField(high=42.0)
+    low_high_field = DecimalField(low=-42.0, high=42.0)
+
+
+class NotEmptyValidator(Validator):
+    field1 = StringField(required=False, validators=[validate_not_empty()])
+
+
+class RequiredValidatorListValidator(Validator):
+    field1 = StringField(validators=[validate_required()])
+
+
+class OptionalDatesValidator(Validator):
+    date_field = DateField()
+    time_field = TimeField()
+    datetime_field = DateTimeField()
+
+
+class RequiredDatesValidator(Validator):
+    date_field = DateField(required=True)
+    time_field = TimeField(required=True)
+    datetime_field = DateTimeField(required=True)
+
+
+class DateRangeValidator(Validator):
+    date_field = DateField(low='jan 1, 2010', high='dec 1, 2010')
+
+
+class DefaultValidator(Validator):
+    str_field = StringField(required=True, default='timster')
+
+
+class CallableDefaultValidator(Validator):
+    str_field = StringField(required=True, default=getname)
+
+
+class LengthsValidator(Validator):
+    max_field = StringField(max_length=5)
+    min_field = StringField(min_length=5)
+    len_field = StringField(validators=[validate_length(equal=10)])
+
+
+class RangeValidator(Validator):
+    range1 = IntegerField(low=1, high=5)
+    range2 = IntegerField(low=1, high=5)
+
+
+class ChoicesValidator(Validator):
+    first_name = StringField(validators=[validate_one_of(('tim', 'bob'))])
+
+
+class CallableChoicesValidator(Validator):
+    first_name = StringField(validators=[validate_one_of(getchoices)])
+
+
+class IntegerChoicesValidator(Validator):
+    int_field = IntegerField(validators=[validate_one_of((1, 2, 3))])
+
+
+class ExcludeChoicesValidator(Validator):
+    first_name = StringField(validators=[validate_none_of(('tim', 'bob'))])
+
+
+class CallableExcludeChoicesValidator(Validator):
+    first_name = StringField(validators=[validate_none_of(getchoices)])
+
+
+class EqualValidator(Validator):
+    first_name = StringField(validators=[validate_equal('tim')])
 
-    validator = TestValidator()
+
+class RegexpValidator(Validator):
+    first_name = StringField(validators=[validate_regexp('^[i-t]+$')])
+
+
+class EmailValidator(Validator):
+    email = StringField(validators=[validate_email()])
+
+
+class FunctionValidator(Validator):
+    first_name = StringField(validators=[validate_function(alwaystim)])
+
+    class Meta:
+        messages = {
+            'function': 'your name must be tim'
+        }
+
+
+class OnlyExcludeValidator(Validator):
+    field1 = StringField(required=True)
+    field2 = StringField(required=True)
+
+
+class CleanFieldValidator(Validator):
+    field1 = StringField(required=True)
+
+    def clean_field1(self, value):
+        return value + '-awesome'
+
+
+class CleanFieldMixin:
+    def clean_field1(self, value):
+        return value + '-mixin'
+
+
+class MixinCleanFieldValidator(CleanFieldMixin, Validator):
+    field1 = StringField(required=True)
+
+
+class CleanFieldErrorValidator(Validator):
+    field1 = StringField(required=True)
+
+    def clean_field1(self, value):
+        raise ValidationError('required')
+
+
+class CleanValidator(Validator):
+    field1 = StringField(required=True)
+
+    def clean(self, data):
+        data['field1'] += 'awesome'
+        return data
+
+
+class CleanErrorValidator(Validator):
+    field1 = StringField(required=True)
+
+    def clean(self, data):
+        raise ValidationError('required')
+
+
+class CustomMessagesValidator(Validator):
+    field1 = StringField(required=True)
+    field2 = StringField(required=True)
+    field3 = IntegerField(required=True)
+
+    class Meta:
+        messages = {
+            'required': 'enter value',
+            'field2.required': 'field2 required',
+            'field3.coerce_int': 'pick a number',
+        }
+
+
+class ExtraMetaValidator(Validator):
+    field1 = StringField()
+
+    class Meta:
+        extra_option = 'x'
+
+
+class ParentValidator(Validator):
+    field1 = StringField(required=True)
+    field2 = StringField(required=False)
+
+
+class ChildValidator(ParentValidator):
+    field2 = StringField(required=True)
+    field3 = StringField(required=True)
+
+
+class OtherParentValidator(Validator):
+    field3 = StringField(required=True)
+
+
+class MultipleParentValidator(ParentValidator, OtherParentValidator):
+    pass
+
+
+def test_raw_field():
+    validator = RawFieldValidator()
     valid = validator.validate({'field1': 'thing'})
     assert valid
     assert validator.data['field1'] == 'thing'
 
 
 def test_required():
-    class TestValidator(Validator):
-        bool_field = BooleanField(required=True)
-        decimal_field = DecimalField(required=True)
-        float_field = FloatField(required=True, low=10.0, high=50.0)
-        int_field = IntegerField(required=True)
-        str_field = StringField(required=True)
-        date_field = DateField(required=True, low='jan 1, 2010', high='dec 1, 2010')
-        time_field = TimeField(required=True, low='9 am', high='10 am')
-        datetime_field = DateTimeField(required=True, low='jan 1, 2010', high='dec 1, 2010')
-
-    validator = TestValidator()
+    validator = RequiredFieldsValidator()
     valid = validator.validate()
     assert not valid
-    assert validator.errors['bool_field'] == DEFAULT_MESSAGES['required']
-    assert validator.errors['decimal_field'] == DEFAULT_MESSAGES['required']
-    assert validator.errors['float_field'] == DEFAULT_MESSAGES['required']
-    assert validator.errors['int_field'] == DEFAULT_MESSAGES['required']
-    assert validator.errors['str_field'] == DEFAULT_MESSAGES['required']
-    assert validator.errors['date_field'] == DEFAULT_MESSAGES['required']
-    assert validator.errors['time_field'] == DEFAULT_MESSAGES['required']
-    assert validator.errors['datetime_field'] == DEFAULT_MESSAGES['required']
+    assert validator.errors == {name: DEFAULT_MESSAGES['required'] for name in validator._meta.fields}
 
 
 def test_integerfield():
-    class TestValidator(Validator):
-        int_field = IntegerField(required=True)
-
     data = {'int_field': 0}
-    validator = TestValidator()
+    validator = IntegerValidator()
     valid = validator.validate(data)
     assert valid
 
 
 def test_coerce_fails():
-    class TestValidator(Validator):
-        float_field = FloatField()
-        int_field = IntegerField(required=True)
-        decimal_field = DecimalField(required=True)
-        boolean_field = BooleanField()
-
-    validator = TestValidator()
+    validator = CoerceValidator()
     data = {'int_field': 'a', 'float_field': 'a', 'decimal_field': 'a', 'boolean_field': 'false'}
     valid = validator.validate(data)
     assert not valid
@@ -85,12 +273,7 @@ def test_coerce_fails():
 
 
 def test_decimal():
-    class TestValidator(Validator):
-        low_field = DecimalField(low=-42.0)
-        high_field = DecimalField(high=42.0)
-        low_high_field = DecimalField(low=-42.0, high=42.0)
-
-    validator = TestValidator()
+    validator = DecimalRangeValidator()
     data = {'low_field': '-99.99', 'high_field': '99.99', 'low_high_field': '99.99'}
     valid = validator.validate(data)
     assert not valid
@@ -99,11 +282,18 @@ def test_decimal():
     assert validator.errors['low_high_field'] == 'Must be between -42.0 and 42.0.'
 
 
-def test_required_empty():
-    class TestValidator(Validator):
-        field1 = StringField(required=False, validators=[validate_not_empty()])
+def test_required_validator():
+    validator = RequiredValidatorListValidator()
+    valid = validator.validate()
+    assert not valid
+    assert validator.errors['field1'] == DEFAULT_MESSAGES['required']
+
+    valid = validator.validate({'field1': 'tim'})
+    assert valid
+
 
-    validator = TestValidator()
+def test_required_empty():
+    validator = NotEmptyValidator()
 
     valid = validator.validate()
     assert valid
@@ -114,18 +304,13 @@ def test_required_empty():
 
 
 def test_dates_empty():
-    class TestValidator(Validator):
-        date_field = DateField()
-        time_field = TimeField()
-        datetime_field = DateTimeField()
-
     data = {
         'date_field': '',
         'time_field': '',
         'datetime_field': '',
     }
 
-    validator = TestValidator()
+    validator = OptionalDatesValidator()
     valid = validator.validate(data)
 
     print(validator.errors)
@@ -135,40 +320,25 @@ def test_dates_empty():
     assert not validator.data['time_field']
 
 
-def test_dates_coersions():
-    class TestValidator(Validator):
-        date_field = DateField(required=True)
-        time_field = TimeField(required=True)
-        datetime_field = DateTimeField(required=True)
-
-    data = {
+@pytest.mark.parametrize('data', [
+    {
         'date_field': 'jan 1, 2015',
         'time_field': 'jan 1, 2015 3:20 pm',
         'datetime_field': 'jan 1, 2015 3:20 pm',
-    }
-
-    validator = TestValidator()
-    valid = validator.validate(data)
-
-    assert valid
-    assert validator.data['datetime_field'] == datetime(2015, 1, 1, 15, 20)
-    assert validator.data['date_field'] == date(2015, 1, 1)
-    assert validator.data['time_field'] == time(15, 20)
-
-
-def test_dates_native():
-    class TestValidator(Validator):
-        date_field = DateField(required=True)
-        time_field = TimeField(required=True)
-        datetime_field = DateTimeField(required=True)
-
-    data = {
+    },
+    {
+        'date_field': '2015-01-01',
+        'time_field': '15:20',
+        'datetime_field': '2015-01-01 15:20',
+    },
+    {
         'date_field': date(2015, 1, 1),
         'time_field': time(15, 20),
         'datetime_field': datetime(2015, 1, 1, 15, 20),
-    }
-
-    validator = TestValidator()
+    },
+], ids=['freeform', 'iso', 'native'])
+def test_dates_coersions(data):
+    validator = RequiredDatesValidator()
     valid = validator.validate(data)
 
     assert valid
@@ -178,18 +348,13 @@ def test_dates_native():
 
 
 def test_date_coerce_fail():
-    class TestValidator(Validator):
-        date_field = DateField(required=True)
-        time_field = TimeField(required=True)
-        datetime_field = DateTimeField(required=True)
-
     data = {
         'date_field': 'failure',
         'time_field': 'failure',
         'datetime_field': 'failure',
     }
 
-    validator = TestValidator()
+    validator = RequiredDatesValidator()
     valid = validator.validate(data)
 
     assert not valid
@@ -198,36 +363,37 @@ def test_date_coerce_fail():
     assert validator.errors['time_field'] == DEFAULT_MESSAGES['coerce_time']
 
 
-def test_default():
-    class TestValidator(Validator):
-        str_field = StringField(required=True, default='timster')
+def test_date_range():
+    validator = DateRangeValidator()
+    valid = validator.validate({'date_field': 'jun 1, 2010'})
+    assert valid
+
+    valid = validator.validate({'date_field': ''})
+    assert valid
+    assert validator.data['date_field'] is None
 
-    validator = TestValidator()
+    valid = validator.validate({'date_field': 'jun 1, 2020'})
+    assert not valid
+    assert validator.errors['date_field'] == DEFAULT_MESSAGES['range_between'].format(
+        low=date(2010, 1, 1), high=date(2010, 12, 1))
+
+
+def test_default():
+    validator = DefaultValidator()
     valid = validator.validate()
     assert valid
     assert validator.data['str_field'] == 'timster'
 
 
 def test_callable_default():
-    def getname():
-        return 'timster'
-
-    class TestValidator(Validator):
-        str_field = StringField(required=True, default=getname)
-
-    validator = TestValidator()
+    validator = CallableDefaultValidator()
     valid = validator.validate()
     assert valid
     assert validator.data['str_field'] == 'timster'
 
 
 def test_lengths():
-    class TestValidator(Validator):
-        max_field = StringField(max_length=5)
-        min_field = StringField(min_length=5)
-        len_field = StringField(validators=[validate_length(equal=10)])
-
-    validator = TestValidator()
+    validator = LengthsValidator()
     valid = validator.validate({'min_field': 'shrt', 'max_field': 'toolong', 'len_field': '3'})
     assert not valid
     assert validator.errors['min_field'] == DEFAULT_MESSAGES['length_low'].format(low=5)
@@ -236,11 +402,7 @@ def test_lengths():
 
 
 def test_range():
-    class TestValidator(Validator):
-        range1 = IntegerField(low=1, high=5)
-        range2 = IntegerField(low=1, high=5)
-
-    validator = TestValidator()
+    validator = RangeValidator()
     valid = validator.validate({'range1': '44', 'range2': '3'})
     assert not valid
     assert validator.errors['range1'] == DEFAULT_MESSAGES['range_between'].format(low=1, high=5)
@@ -248,157 +410,93 @@ def test_range():
 
 
 def test_coerce_error():
-    class TestValidator(Validator):
-        date_field = DateField()
-
-    validator = TestValidator()
+    validator = OptionalDatesValidator()
     valid = validator.validate({'date_field': 'not a real date'})
     assert not valid
     assert validator.errors['date_field'] == DEFAULT_MESSAGES['coerce_date']
 
 
-def test_choices():
-    class TestValidator(Validator):
-        first_name = StringField(validators=[validate_one_of(('tim', 'bob'))])
-
-    validator = TestValidator()
+@pytest.mark.parametrize('validator_class', [ChoicesValidator, CallableChoicesValidator],
+                         ids=['static', 'callable'])
+def test_choices(validator_class):
+    validator = validator_class()
     valid = validator.validate()
     assert valid
 
-    validator = TestValidator()
     valid = validator.validate({'first_name': 'tim'})
     assert valid
 
-    validator = TestValidator()
     valid = validator.validate({'first_name': 'asdf'})
     assert not valid
     assert validator.errors['first_name'] == DEFAULT_MESSAGES['one_of'].format(choices='tim, bob')
 
 
 def test_choices_integers():
-    class TestValidator(Validator):
-        int_field = IntegerField(validators=[validate_one_of((1, 2, 3))])
-
-    validator = TestValidator()
+    validator = IntegerChoicesValidator()
     valid = validator.validate({'int_field': 4})
     assert not valid
 
 
-def test_exclude():
-    class TestValidator(Validator):
-        first_name = StringField(validators=[validate_none_of(('tim', 'bob'))])
-
-    validator = TestValidator()
-    valid = validator.validate({'first_name': 'tim'})
-    assert not valid
-    assert validator.errors['first_name'] == DEFAULT_MESSAGES['none_of'].format(choices='tim, bob')
-
-    validator = TestValidator()
-    valid = validator.validate({'first_name': 'asdf'})
-    assert valid
-
-
-def test_callable_choices():
-    def getchoices():
-        return ('tim', 'bob')
-
-    class TestValidator(Validator):
-        first_name = StringField(validators=[validate_one_of(getchoices)])
-
-    validator = TestValidator()
-    valid = validator.validate({'first_name': 'asdf'})
-    assert not valid
-    assert validator.errors['first_name'] == DEFAULT_MESSAGES['one_of'].format(choices='tim, bob')
-
-    validator = TestValidator()
-    valid = validator.validate({'first_name': 'tim'})
-    assert valid
-
-
-def test_callable_exclude():
-    def getchoices():
-        return ('tim', 'bob')
-
-    class TestValidator(Validator):
-        first_name = StringField(validators=[validate_none_of(getchoices)])
-
-    validator = TestValidator()
+@pytest.mark.parametrize('validator_class', [ExcludeChoicesValidator, CallableExcludeChoicesValidator],
+                         ids=['static', 'callable'])
+def test_exclude(validator_class):
+    validator = validator_class()
     valid = validator.validate({'first_name': 'tim'})
     assert not valid
     assert validator.errors['first_name'] == DEFAULT_MESSAGES['none_of'].format(choices='tim, bob')
 
-    validator = TestValidator()
     valid = validator.validate({'first_name': 'asdf'})
     assert valid
 
 
 def test_equal():
-    class TestValidator(Validator):
-        first_name = StringField(validators=[validate_equal('tim')])
-
-    validator = TestValidator()
+    validator = EqualValidator()
     valid = validator.validate({'first_name': 'tim'})
     assert valid
 
-    validator = TestValidator()
     valid = validator.validate({'first_name': 'asdf'})
     assert not valid
     assert validator.errors['first_name'] == DEFAULT_MESSAGES['equal'].format(other='tim')
 
 
 def test_regexp():
-    class TestValidator(Validator):
-        first_name = StringField(validators=[validate_regexp('^[i-t]+$')])
-
-    validator = TestValidator()
+    validator = RegexpValidator()
     valid = validator.validate({'first_name': 'tim'})
     assert valid
 
-    validator = TestValidator()
     valid = validator.validate({'first_name': 'asdf'})
     assert not valid
     assert validator.errors['first_name'] == DEFAULT_MESSAGES['regexp'].format(pattern='^[i-t]+$')
 
 
 def test_email():
-    class TestValidator(Validator):
-        email = StringField(validators=[validate_email()])
-
-    validator = TestValidator()
+    validator = EmailValidator()
     valid = validator.validate({'email': 'bad-domain@asdfasdf'})
     assert not valid
     assert validator.errors['email'] == DEFAULT_MESSAGES['email']
 
 
 def test_function():
-    def alwaystim(value):
-        if value == 'tim':
-            return True
-
-    class TestValidator(Validator):
-        first_name = StringField(validators=[validate_function(alwaystim)])
-
-        class Meta:
-            messages = {
-                'function': 'your name must be tim'
-            }
-
-    validator = TestValidator()
+    validator = FunctionValidator()
     valid = validator.validate({'first_name': 'tim'})
     assert valid
 
-    validator = TestValidator()
     valid = validator.validate({'first_name': 'asdf'})
     assert not valid
     assert validator.errors['first_name'] == validator._meta.messages['function']
 
 
-def test_only_exclude():
-    class TestValidator(Validator):
-        field1 = StringField(required=True)
-        field2 = StringField(required=True)
+def test_validate_many():
+    validator = IntegerValidator()
+    results = validator.validate_many([{'int_field': 10}, {}, {'int_field': 'nope'}])
+
+    assert results[0] == (True, {'int_field': 10}, {})
+    assert results[1] == (False, {}, {'int_field': DEFAULT_MESSAGES['required']})
+    assert results[2] == (False, {}, {'int_field': DEFAULT_MESSAGES['coerce_int']})
 
-    validator = TestValidator()
+
+def test_only_exclude():
+    validator = OnlyExcludeValidator()
     valid = validator.validate({'field1': 'shrt'}, only=['field1'])
     assert valid
 
@@ -407,26 +505,21 @@ def test_only_exclude():
 
 
 def test_clean_field():
-    class TestValidator(Validator):
-        field1 = StringField(required=True)
-
-        def clean_field1(self, value):
-            return value + '-awesome'
-
-    validator = TestValidator()
+    validator = CleanFieldValidator()
     valid = validator.validate({'field1': 'tim'})
     assert valid
     assert validator.data['field1'] == 'tim-awesome'
 
 
-def test_clean_field_error():
-    class TestValidator(Validator):
-        field1 = StringField(required=True)
+def test_clean_field_mixin():
+    validator = MixinCleanFieldValidator()
+    valid = validator.validate({'field1': 'tim'})
+    assert valid
+    assert validator.data['field1'] == 'tim-mixin'
 
-        def clean_field1(self, value):
-            raise ValidationError('required')
 
-    validator = TestValidator()
+def test_clean_field_error():
+    validator = CleanFieldErrorValidator()
     valid = validator.validate({'field1': 'tim'})
     assert not valid
     assert validator.data['field1'] == 'tim'
@@ -434,27 +527,14 @@ def test_clean_field_error():
 
 
 def test_clean():
-    class TestValidator(Validator):
-        field1 = StringField(required=True)
-
-        def clean(self, data):
-            data['field1'] += 'awesome'
-            return data
-
-    validator = TestValidator()
+    validator = CleanValidator()
     valid = validator.validate({'field1': 'tim'})
     assert valid
     assert validator.data['field1'] == 'timawesome'
 
 
 def test_clean_error():
-    class TestValidator(Validator):
-        field1 = StringField(required=True)
-
-        def clean(self, data):
-            raise ValidationError('required')
-
-    validator = TestValidator()
+    validator = CleanErrorValidator()
     valid = validator.validate({'field1': 'tim'})
     assert not valid
     assert validator.data['field1'] == 'tim'
@@ -462,38 +542,35 @@ def test_clean_error():
 
 
 def test_custom_messages():
-    class TestValidator(Validator):
-        field1 = StringField(required=True)
-        field2 = StringField(required=True)
-        field3 = IntegerField(required=True)
-
-        class Meta:
-            messages = {
-                'required': 'enter value',
-                'field2.required': 'field2 required',
-                'field3.coerce_int': 'pick a number',
-            }
-
-    validator = TestValidator()
+    validator = CustomMessagesValidator()
     valid = validator.validate({'field3': 'asdfasdf'})
     assert not valid
-    assert validator.errors['field1'] == 'enter value'
-    assert validator.errors['field2'] == 'field2 required'
-    assert validator.errors['field3'] == 'pick a number'
+    assert validator.errors == {
+        'field1': 'enter value',
+        'field2': 'field2 required',
+        'field3': 'pick a number',
+    }
 
 
-def test_subclass():
-    class ParentValidator(Validator):
-        field1 = StringField(required=True)
-        field2 = StringField(required=False)
+def test_extra_meta_option():
+    validator = ExtraMetaValidator()
+    assert validator._meta.extra_option == 'x'
+    valid = validator.validate({'field1': 'tim'})
+    assert valid
 
-    class TestValidator(ParentValidator):
-        field2 = StringField(required=True)
-        field3 = StringField(required=True)
 
-    validator = TestValidator()
+def test_subclass():
+    validator = ChildValidator()
     valid = validator.validate({})
     assert not valid
     assert validator.errors['field1'] == DEFAULT_MESSAGES['required']
     assert validator.errors['field2'] == DEFAULT_MESSAGES['required']
     assert validator.errors['field3'] == DEFAULT_MESSAGES['required']
+
+
+def test_multiple_inheritance():
+    validator = MultipleParentValidator()
+    valid = validator.validate({})
+    assert not valid
+    assert validator.errors['field1'] == DEFAULT_MESSAGES['required']
+    assert validator.errors['field3'] == DEFAULT_MESSAGES['required']
@@ -30,7 +30,7 @@ def test_required():
     validator = ModelValidator(Person())
     valid = validator.validate()
     assert not valid
-    assert validator.errors['name'] == DEFAULT_MESSAGES['required']
+    assert validator.errors == {'name': DEFAULT_MESSAGES['required']}
 
 
 def test_clean():
@@ -142,15 +142,19 @@ def test_related_optional_dict_missing():
     assert valid
 
 
-def test_unique():
-    person = Person.create(name='tim')
+@pytest.fixture
+def existing_person():
+    """A saved person for uniqueness collisions; rolled back after each test."""
+    return Person.create(name='tim')
 
+
+def test_unique(existing_person):
     validator = ModelValidator(Person(name='tim'))
     valid = validator.validate({'gender': 'M'})
     assert not valid
     assert validator.errors['name'] == DEFAULT_MESSAGES['unique']
 
-    validator = ModelValidator(person)
+    validator = ModelValidator(existing_person)
     valid = validator.validate({'gender': 'M'})
     assert valid
 
@@ -162,8 +166,10 @@ def test_unique_index():
     validator = ModelValidator(obj2)
     valid = validator.validate()
     assert not valid
-    assert validator.errors['field1'] == DEFAULT_MESSAGES['index']
-    assert validator.errors['field2'] == DEFAULT_MESSAGES['index']
+    assert validator.errors == {
+        'field1': DEFAULT_MESSAGES['index'],
+        'field2': DEFAULT_MESSAGES['index'],
+    }
 
     validator = ModelValidator(obj1)
     valid = validator.validate()
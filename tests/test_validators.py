@@ -102,6 +102,19 @@ def test_validate_one_of():
         validator(field, {})
 
 
+def test_validate_one_of_unhashable():
+    validator = validate_one_of((['a'], ['b']))
+
+    for value in (None, ['a'], ['b']):
+        field.value = value
+        validator(field, {})
+
+    for value in (['c'], 'a'):
+        field.value = value
+        with pytest.raises(ValidationError):
+            validator(field, {})
+
+
 def test_validate_none_of():
     validator = validate_none_of(('a', 'b', 'c'))
 
@@ -115,6 +128,18 @@ def test_validate_none_of():
         validator(field, {})
 
 
+def test_validate_none_of_unhashable():
+    validator = validate_none_of((['a'], ['b']))
+
+    for value in (None, ['c'], 'a'):
+        field.value = value
+        validator(field, {})
+
+    field.value = ['a']
+    with pytest.raises(ValidationError):
+        validator(field, {})
+
+
 def test_validate_range():
     validator = validate_range(low=10, high=100)
 